@@ -1,6 +1,8 @@
 import streamlit as st
 from src.create_pitch import plot_team
 from src.milp_solver import optimize_squad
+from src.player_pool import load_player_pool
+from src.squad_cache import SquadResultCache, estimate_session_bytes
 import pandas as pd
 from pathlib import Path
 import json
@@ -14,11 +16,20 @@ st.set_page_config(
     layout="wide"
 )
 
-@st.cache_data
-def load_players():
+# cache_resource: one pool and one result cache per process, shared by every
+# session (cache_data would hand each caller its own deserialized copy)
+@st.cache_resource
+def get_player_pool():
+    # prefer the columnar export (scripts/export_player_pool.py) over the JSON
+    columnar_dir = BASE_DIR / "data" / "final_squad_cleaned"
+    if columnar_dir.is_dir():
+        return load_player_pool(columnar_dir)
     player_data_file = BASE_DIR / "data" / "final_squad_cleaned.json"
-    df = pd.read_json(player_data_file, orient='records')
-    return df
+    return load_player_pool(player_data_file)
+
+@st.cache_resource
+def get_squad_cache():
+    return SquadResultCache(max_entries=256)
 
 def formation_str_to_tuple(formation_str: str) -> tuple:
     parts = tuple(map(int, formation_str.split("-")))
@@ -91,22 +102,21 @@ def player_filtering_section():
     if len(st.session_state.locked_players) >= 3:
         st.warning("⚠️ Maximum 3 players can be locked")
         return
-    players_df = load_players()
-    nationalities = sorted(players_df['Nationality'].unique()) 
+    pool = get_player_pool()
+    nationalities = pool.nationalities
     # Country selection
     selected_country = st.selectbox("Country", ['-- Select Country --'] + nationalities, key="country_select")
     
     if selected_country != '-- Select Country --':
         # Filter players by country
-        country_players = players_df[players_df['Nationality'] == selected_country]
-        player_options = sorted(country_players['Name'].tolist())
+        player_options = pool.players_by_country(selected_country)
         
         # Player selection
         selected_player = st.selectbox("Player",['-- Select Player --'] + player_options, key="player_select" )
         
         if selected_player != '-- Select Player --':
             # Get player data
-            player_data = players_df[players_df['Name'] == selected_player].iloc[0]
+            player_data = pool.player(selected_player)
             player_roles = player_data['PossiblePositions']
             
             st.info(f"**Wage:** €{player_data.get('WageEUR', 0)/1_000_000:.1f}M | **Age:** {player_data['Age']}")     
@@ -142,15 +152,25 @@ def render_results(budget, formation, style, age_range):
     #         for name, info in st.session_state.locked_players.items():
     #             st.write(f"- {name}: €{info['wage']:,}")
     
-    # Run MILP  
- 
-    solution = optimize_squad(
-        budget_eur, 
-        formation,
-        style,
-        locked_players=st.session_state.locked_players,
-        age=age_range
+    # Run MILP (or reuse a result another session already solved)
+    squad_cache = get_squad_cache()
+    cache_key = squad_cache.make_key(budget_eur, formation, style, age_range,
+                                     st.session_state.locked_players)
+    solution, hit = squad_cache.get_or_solve(
+        cache_key,
+        lambda: optimize_squad(
+            budget_eur, 
+            formation,
+            style,
+            locked_players=st.session_state.locked_players,
+            age=age_range,
+            player_squad=get_player_pool().records
+        )
     )
+    if hit:
+        st.session_state.cache_hits += 1
+    else:
+        st.session_state.cache_misses += 1
    
     status = solution['status']
 
@@ -181,6 +201,18 @@ def render_results(budget, formation, style, age_range):
                 hide_index=True
             )
 
+def render_cache_stats():
+    """Per-session memory and shared cache statistics"""
+    with st.expander("📈 Cache Statistics"):
+        pool = get_player_pool()
+        stats = get_squad_cache().stats()
+        st.metric("Session Memory", f"{estimate_session_bytes(st.session_state)/1024:.1f} KB")
+        st.metric("Session Cache Hits", f"{st.session_state.cache_hits}/"
+                  f"{st.session_state.cache_hits + st.session_state.cache_misses}")
+        st.write(f"Shared pool: {len(pool)} players, {pool.memory_bytes()/1_000_000:.1f} MB")
+        st.write(f"Shared results: {stats['entries']}/{stats['max_entries']} entries, "
+                 f"hit rate {stats['hit_rate']:.0%}, {stats['evictions']} evictions")
+
 def render_layout():
     """Main layout function: full-width three-column layout"""
     
@@ -213,6 +245,7 @@ def render_layout():
         player_filtering_section()
         st.markdown("---")
         render_locked_players()
+        render_cache_stats()
 
 if __name__ == '__main__':
     # Initialize session state
@@ -228,6 +261,12 @@ if __name__ == '__main__':
     if "current_budget" not in st.session_state:
         st.session_state.current_budget = 80  # Default budget in millions
 
+    if "cache_hits" not in st.session_state:
+        st.session_state.cache_hits = 0
+
+    if "cache_misses" not in st.session_state:
+        st.session_state.cache_misses = 0
+
     # Page title
     st.title("⚽ Football Squad Optimizer")
     
@@ -0,0 +1,56 @@
+import sys
+import time
+from pathlib import Path
+
+import pulp as pl
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+
+from src.chemistry import ChemistrySquadSolver
+from src.milp_solver import SquadMILPSolver
+from src.synthetic_pool import generate_synthetic_pool
+
+
+def run(solver_cls, players, budget, time_limit, **kwargs):
+    solver = solver_cls(players, formation=(4, 3, 3, 1), age=None, total_budget=budget,
+                        playing_style='attack', locked_players={}, **kwargs)
+    start = time.perf_counter()
+    results = solver.solve(pl.PULP_CBC_CMD(msg=0, timeLimit=time_limit))
+    return (time.perf_counter() - start, solver.model.numVariables(),
+            solver.model.numConstraints(), results)
+
+
+if __name__ == '__main__':
+    # model size, solve time and objective of the chemistry objective vs the additive
+    # one, over budgets from binding (300k) to barely binding (1.5M). The shortlisted
+    # pair graph (default) is a heuristic, 'full' is the exact graph over the whole
+    # pool and is only run up to FULL_GRAPH_MAX players as it gets slow quickly.
+    pool_sizes = [int(n) for n in sys.argv[1:]] or [1_000, 2_500, 5_000, 10_000]
+    budgets = [300_000, 600_000, 1_500_000]
+    time_limit = 300
+    FULL_GRAPH_MAX = 2_500
+    variants = [('additive', SquadMILPSolver, {}),
+                ('mccormick', ChemistrySquadSolver, {'linearization': 'mccormick'}),
+                ('aggregated', ChemistrySquadSolver, {'linearization': 'aggregated'}),
+                ('full', ChemistrySquadSolver, {'linearization': 'mccormick', 'shortlist_per_role': None})]
+
+    print(f"{'players':>8} | {'budget':>9} | {'model':<10} | {'vars':>7} | {'constrs':>7} | "
+          f"{'time (s)':>8} | {'objective':>9} | {'vs full':>8}")
+    for n in pool_sizes:
+        players = generate_synthetic_pool(n, seed=3)
+        for budget in budgets:
+            rows = []
+            for label, solver_cls, kwargs in variants:
+                if label == 'full' and n > FULL_GRAPH_MAX:
+                    continue
+                elapsed, n_vars, n_cons, results = run(solver_cls, players, budget, time_limit, **kwargs)
+                objective = results.get('objective', float('nan'))
+                if elapsed >= time_limit:
+                    label += '*'  # hit the time limit, objective is not proven optimal
+                rows.append((label, n_vars, n_cons, elapsed, objective))
+            full = next((r[4] for r in rows if r[0] == 'full'), None)
+            for label, n_vars, n_cons, elapsed, objective in rows:
+                gap = f"{(full - objective) / full:.2%}" if full and label != 'additive' else '-'
+                print(f"{n:>8} | {budget:>9} | {label:<10} | {n_vars:>7} | {n_cons:>7} | "
+                      f"{elapsed:>8.2f} | {objective:>9.1f} | {gap:>8}")
@@ -0,0 +1,201 @@
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+from bs4 import BeautifulSoup as bs
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+
+import src.scrape_data as scrape_data
+from src.scrape_data import get_available_scout_urls, get_player_url, parse_scout_page, parse_player_meta
+from curl_cffi import requests
+
+FIXTURE_DIR = BASE_DIR / "data" / "fixtures" / "html"
+# saved pages lose their URL, the player id is only read from it
+FIXTURE_URL = "https://fbref.com/en/players/00000000/scout/fixture"
+
+
+def serve_saved_page(html):
+    """Point scrape_data at a saved page instead of FBref: the kept fetch
+    functions run unchanged, only requests.get is replaced"""
+    page = SimpleNamespace(text=html, content=html.encode('utf-8'), url=FIXTURE_URL)
+    scrape_data.requests = SimpleNamespace(get=lambda *args, **kwargs: page)
+
+
+def legacy_scout_stats(html, player_id, report_name):
+    """Previous path: get_per_scout_report (bs4 preset + pd.read_html) and the
+    iterrows loop run_ingestion had before the single pass parser"""
+    serve_saved_page(html)
+    tab_name, df = scrape_data.get_per_scout_report(FIXTURE_URL)
+    df.columns = [col[1] if isinstance(col, tuple) else col for col in df.columns]
+    stats_to_save = []
+
+    for index, row in df.iterrows():
+        if pd.isna(row['Statistic']) or row['Statistic'] == 'Statistic':
+            continue
+        # Build a tuple for each row
+        stats_to_save.append((
+            player_id,
+            report_name,
+            tab_name,
+            row['Statistic'],
+            row['Per 90'],
+            row['Percentile']
+        ))
+    return tab_name, stats_to_save
+
+
+def legacy_static_meta(player_name):
+    """get_static_meta before the single pass parser, unchanged"""
+    response = get_player_url(player_name)
+    if '/players/' in response.url:
+        id = re.search(r'players/([a-z0-9]+)/', response.url).group(1)
+        soup = bs(response.text,'html.parser')
+    else:
+        id,name,position,footed,height,weight,birth_date,birth_place,club,weekly_wage,currency=None,None,None,None,None,None,None,None,None,None,None
+    meta = soup.find('div', id='meta')
+    if not meta: return {}
+    raw_text = meta.get_text(separator=" ").replace('\xa0', ' ')
+    clean_text = " ".join(raw_text.split())
+    # Remove the specific 'pt ' artifact that FBRef injects
+    clean_text = clean_text.replace(" pt ", " ")
+    # 2. Extraction using targeted patterns
+    name = soup.find('h1').text.strip()
+    # Height/Weight (Digits before cm/kg)
+    height = re.search(r'(\d+)cm', clean_text).group(1) if re.search(r'(\d+)cm', clean_text) else "N/A"
+    weight = re.search(r'(\d+)kg', clean_text).group(1) if re.search(r'(\d+)kg', clean_text) else "N/A"
+    pos_match = re.search(r'Position:\s*(.*?)(?=\s*(?:\d{3}cm|[▪,]|Footed:|Born:|$))', clean_text)
+    footed = re.search(r'Footed: (\w+)',clean_text).group(1) if re.search(r'Footed: (\w+)', clean_text) else "N/A"
+    position =  pos_match.group(1).strip().rstrip(',') if pos_match else 'N/A'
+    # Birth Date: Look for the pattern 'Month Day, Year'
+    birth_date = "N/A"
+    date_match = re.search(r'([A-Z][a-z]+ \d{1,2}, \d{4})', clean_text)
+    if date_match:
+        birth_date = date_match.group(1)
+    # Birth Place: Find text between the Year and the next major label (National Team/Club)
+    birth_place = "N/A"
+    if birth_date != "N/A":
+        place_pattern = re.escape(birth_date) + r'\s+in\s+(.*?)(?=National|Club|Born|$)'
+        place_match = re.search(place_pattern, clean_text)
+        if place_match:
+            birth_place = place_match.group(1).replace("pt", "").strip()
+    # Pattern: Look for currency symbol, then digits/commas, then the word "Weekly"
+    wage_match = re.search(r'([￡$€])\s*([\d,]+)\s*(Weekly|Monthly|Yearly)', clean_text)
+    if wage_match:
+        currency = wage_match.group(1)
+        amount = int(wage_match.group(2).replace(',', ''))
+        frequency = wage_match.group(3)
+        # Normalize all to Weekly
+        if frequency == 'Monthly':
+            weekly_wage = amount // 4
+        elif frequency == 'Yearly':
+            weekly_wage = amount // 52
+        else:
+            weekly_wage = amount
+    else:
+        currency = "N/A"
+        weekly_wage = 'N/A'
+    # Club: Extract specifically after 'Club:' and stop before Instagram
+    club_match = re.search(r'Club:\s*(.*?)(?=\s*(?:Wages|Instagram|Contract|Expires|Born|$))', clean_text)
+    if club_match:
+        club = club_match.group(1).strip().rstrip(':')
+    else:
+        club = "N/A"
+    return {
+        'player_id':id,
+        'name': name,
+        'position': position,
+        'strong_foot':  footed,
+        'height_cm': height,
+        'weight_kg': weight,
+        'birth_date': birth_date,
+        'birth_place': birth_place,
+        'club': club,
+        'wage_weekly': weekly_wage,
+        'currency' : currency
+    }
+
+
+def legacy_meta_parse(html):
+    serve_saved_page(html)
+    return legacy_static_meta('fixture')
+
+
+def normalise(value):
+    """Compare emitted values, not their types: numbers as floats (numpy or
+    python, '1,204.5' or 1204.5), NaN and '' as missing, text stripped"""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    text = str(value).strip()
+    if text in ('', 'nan'):
+        return None
+    try:
+        return float(text.replace(',', ''))
+    except ValueError:
+        return text
+
+
+def same_output(old, new):
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(normalise(old[k]) == normalise(new[k]) for k in old)
+    return len(old) == len(new) and all(
+        [normalise(v) for v in a] == [normalise(v) for v in b] for a, b in zip(old, new))
+
+
+def fetch_fixtures(player_name):
+    """Save a player page and its scout report pages as benchmark fixtures"""
+    FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    slug = re.sub(r'\W+', '_', player_name.lower()).strip('_')
+    response = get_player_url(player_name)
+    (FIXTURE_DIR / f"player_{slug}.html").write_text(response.text, encoding='utf-8')
+    for i, url in enumerate(get_available_scout_urls(player_name).values()):
+        page = requests.get(url, impersonate='chrome', allow_redirects=True)
+        (FIXTURE_DIR / f"scout_{slug}_{i}.html").write_text(page.text, encoding='utf-8')
+        time.sleep(5)
+
+
+def best_of(fn, html, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Parse time per saved FBref page, old vs new parser")
+    parser.add_argument('--fetch', nargs='*', default=[], help="player names to download as fixtures first")
+    parser.add_argument('--fixtures', default=FIXTURE_DIR)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name in args.fetch:
+        fetch_fixtures(name)
+
+    pages = sorted(Path(args.fixtures).glob("*.html"))
+    if not pages:
+        sys.exit(f"no fixtures in {args.fixtures}, run with --fetch 'Player Name' first")
+
+    print(f"{'page':<40} | {'old (ms)':>8} | {'new (ms)':>8} | {'rows':>5} | {'same':>5} | {'speedup':>7}")
+    for page in pages:
+        html = page.read_text(encoding='utf-8')
+        if page.name.startswith('scout_'):
+            old = best_of(lambda h: legacy_scout_stats(h, 'id', 'report'), html, args.repeat)
+            new = best_of(lambda h: parse_scout_page(h, 'id', 'report'), html, args.repeat)
+            old_tab, old_rows = legacy_scout_stats(html, 'id', 'report')
+            new_tab, new_rows = parse_scout_page(html, 'id', 'report')
+            rows = str(len(new_rows))
+            same = old_tab == new_tab and same_output(old_rows, new_rows)
+        else:
+            old = best_of(legacy_meta_parse, html, args.repeat)
+            new = best_of(lambda h: parse_player_meta(h, FIXTURE_URL), html, args.repeat)
+            rows = '-'
+            same = same_output(legacy_meta_parse(html), parse_player_meta(html, FIXTURE_URL))
+        print(f"{page.name[:40]:<40} | {old * 1e3:>8.1f} | {new * 1e3:>8.1f} | {rows:>5} | "
+              f"{'yes' if same else 'NO':>5} | {old / new:>6.1f}x")
@@ -0,0 +1,42 @@
+import sys
+import time
+from pathlib import Path
+
+import pulp as pl
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+
+from src.squad_builder import MatchdaySquadSolver
+from src.synthetic_pool import generate_synthetic_pool
+
+
+def time_solve(players, prune_dominated, budget, time_limit):
+    solver = MatchdaySquadSolver(players, formation=(4, 3, 3, 1), age=None, total_budget=budget,
+                                 playing_style='attack', locked_players={},
+                                 prune_dominated=prune_dominated)
+    start = time.perf_counter()
+    results = solver.solve(pl.PULP_CBC_CMD(msg=0, timeLimit=time_limit))
+    return time.perf_counter() - start, results
+
+
+if __name__ == '__main__':
+    # dominance-pruned vs full-pool matchday squad (XI + 12 bench) on synthetic pools,
+    # over budgets from binding (100k) to barely binding (3M)
+    pool_sizes = [int(n) for n in sys.argv[1:]] or [1_000, 5_000, 10_000]
+    budgets = [100_000, 300_000, 600_000, 3_000_000]
+    time_limit = 600
+
+    print(f"{'players':>8} | {'budget':>9} | {'kept':>6} | {'pruned (s)':>10} | {'full (s)':>8} | {'objective gap':>13}")
+    for n in pool_sizes:
+        players = generate_synthetic_pool(n, seed=42)
+        for budget in budgets:
+            t_pruned, r_pruned = time_solve(players, True, budget, time_limit)
+            t_full, r_full = time_solve(players, False, budget, time_limit)
+            if r_pruned['status'] == 'Optimal' and r_full['status'] == 'Optimal':
+                gap = f"{(r_full['objective'] - r_pruned['objective']) / r_full['objective']:.3%}"
+                kept = r_pruned['kept_players']
+            else:
+                gap = f"{r_pruned['status']}/{r_full['status']}"
+                kept = '-'
+            print(f"{n:>8} | {budget:>9} | {kept:>6} | {t_pruned:>10.2f} | {t_full:>8.2f} | {gap:>13}")
@@ -0,0 +1,86 @@
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+
+from src.columnar_pool import ColumnarPlayerPool, export_columnar
+from src.milp_solver import SquadMILPSolver
+from src.synthetic_pool import generate_synthetic_pool
+
+
+def rss_mb():
+    # resident set size of this process (Linux)
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+def build_model(player_info):
+    """What the app pays per request before CBC runs: the full role-aware model"""
+    solver = SquadMILPSolver(player_info, formation=(4, 3, 3, 1), age=None, total_budget=3_000_000,
+                             playing_style='attack', locked_players={}, total_players=11,
+                             role_aware=True)
+    solver.build_variables()
+    solver.build_objective()
+    solver.build_constraints()
+    return len(solver.x)
+
+
+def load(kind, path):
+    """Runs in a fresh process so the RSS growth only covers this load path"""
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    if kind == 'json-solver':
+        with open(path, "r") as f:
+            checksum = build_model(json.load(f))
+    elif kind == 'columnar-solver':
+        checksum = build_model(ColumnarPlayerPool(path))
+    elif kind == 'json':
+        with open(path, "r") as f:
+            players = json.load(f)
+        checksum = sum(max(p['rating_per_roles'].values()) for p in players)
+    elif kind == 'columnar-mmap':
+        pool = ColumnarPlayerPool(path)
+        # touch the rating matrix like the solver would
+        checksum = float(pool.ratings.max(axis=1).sum())
+    else:
+        players = ColumnarPlayerPool(path).to_records()
+        checksum = sum(max(p['rating_per_roles'].values()) for p in players)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({'seconds': elapsed, 'rss_mb': rss_mb() - rss_before, 'checksum': checksum}))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        load(sys.argv[2], sys.argv[3])
+        sys.exit(0)
+
+    # JSON vs columnar load time and RSS growth on a synthetic pool
+    n_players = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    players = generate_synthetic_pool(n_players, seed=11)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "pool.json"
+        with open(json_path, "w") as f:
+            json.dump(players, f)
+        columnar_path = export_columnar(players, Path(tmp) / "pool")
+        del players
+
+        json_mb = json_path.stat().st_size / 1e6
+        columnar_mb = sum(p.stat().st_size for p in columnar_path.iterdir()) / 1e6
+        print(f"{n_players} players: json {json_mb:.1f} MB on disk, columnar {columnar_mb:.1f} MB")
+        print(f"{'path':<18} | {'load (s)':>8} | {'RSS growth (MB)':>15}")
+        # *-solver: load plus building the MILP, the path optimize_squad takes
+        for kind, path in [('json', json_path), ('columnar-mmap', columnar_path),
+                           ('columnar-records', columnar_path), ('json-solver', json_path),
+                           ('columnar-solver', columnar_path)]:
+            out = subprocess.run([sys.executable, __file__, '--child', kind, str(path)],
+                                 capture_output=True, text=True, check=True).stdout
+            stats = json.loads(out.strip().splitlines()[-1])
+            print(f"{kind:<18} | {stats['seconds']:>8.3f} | {stats['rss_mb']:>15.1f}")
@@ -0,0 +1,34 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pulp as pl
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+
+from src.robust_solver import RobustSquadSelector
+from src.synthetic_pool import generate_synthetic_pool
+
+
+if __name__ == '__main__':
+    # robust selection on a synthetic pool with random per-player rating spreads
+    n_players = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    players = generate_synthetic_pool(n_players, seed=1)
+    rng = np.random.default_rng(0)
+    spreads = {p['Name']: float(rng.uniform(0, 0.3)) for p in players}
+
+    selector = RobustSquadSelector(players, formation=(4, 3, 3, 1), age=None, total_budget=1_500_000,
+                                   playing_style='attack', locked_players={}, spreads=spreads)
+    start = time.perf_counter()
+    results = selector.solve(pl.PULP_CBC_CMD(msg=0))
+    total = time.perf_counter() - start
+
+    print(f"{'theta':>8} | {'nominal':>8} | {'budgeted':>8} | {'worst':>8} | {'cvar':>8}")
+    for c in results['candidates']:
+        print(f"{c['theta']:>8.2f} | {c['nominal']:>8.1f} | {c['budgeted']:>8.1f} | "
+              f"{c['worst_case']:>8.1f} | {c['cvar']:>8.1f}")
+    print(f"{n_players} players, {len(results['candidates'])} candidates, "
+          f"{selector.n_scenarios} scenarios in {total:.2f}s -> cvar {results['cvar']:.1f}")
+    print(f"{results['spread_matched']}/{n_players} players with a measured spread")
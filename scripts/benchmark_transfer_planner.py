@@ -0,0 +1,27 @@
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+
+from src.synthetic_pool import generate_synthetic_pool
+from src.transfer_planner import TransferPlanner
+
+
+if __name__ == '__main__':
+    # three-window rolling-horizon plan on a synthetic league-sized pool
+    n_players = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    players = generate_synthetic_pool(n_players, seed=7)
+    planner = TransferPlanner(players, formation=(4, 3, 3, 1), playing_style='attack',
+                              budgets=[1_500_000, 1_600_000, 1_700_000], max_changes=3)
+    start = time.perf_counter()
+    plan = planner.plan()
+    total = time.perf_counter() - start
+
+    for window in plan:
+        print(f"window {window['window']}: {window['status']:<10} "
+              f"solve {window['solve_time']:.2f}s | season score {window.get('season_score', 0):.1f} "
+              f"| signed {len(window.get('signed', []))} "
+              f"| wage {window.get('total_budget', 0):,}")
+    print(f"{n_players} players, {len(plan)} windows in {total:.2f}s")
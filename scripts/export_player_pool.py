@@ -0,0 +1,19 @@
+import json
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+
+from src.columnar_pool import export_columnar
+
+
+if __name__ == '__main__':
+    # final_squad_cleaned.json -> data/final_squad_cleaned/ (columnar, memory mappable)
+    player_data_file = Path(sys.argv[1]) if len(sys.argv) > 1 else BASE_DIR / "data" / "final_squad_cleaned.json"
+    out_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else player_data_file.with_suffix('')
+
+    with open(player_data_file, "r") as f:
+        player_squad = json.load(f)
+    export_columnar(player_squad, out_dir)
+    print(f"exported {len(player_squad)} players to {out_dir}")
@@ -1,4 +1,4 @@
-from src.scrape_data import get_available_scout_urls, get_player_url, get_per_scout_report,get_static_meta
+from src.scrape_data import get_available_scout_urls, get_player_url, get_scout_report_stats, get_static_meta
 from src.database import init_db, insert_player_data, insert_player_stat
 from typing import Dict,List
 import pandas as pd
@@ -9,6 +9,10 @@ def run_ingestion(player_name:str)-> None:
 
     # extracting and populating the metadata of a player
     meta_data = get_static_meta(player_name=player_name)
+    if not meta_data:
+        # the search did not land on a player page, nothing to insert
+        print(f"\nSkipping {player_name}: no player page found")
+        return
     insert_player_data(meta_data)
 
     id = meta_data['player_id']
@@ -17,22 +21,8 @@ def run_ingestion(player_name:str)-> None:
     # iterate through the scout reports
     
     for report_name,report_url in available_scout_reports.items():
-        tab_name , df = get_per_scout_report(report_url)
-        df.columns = [col[1] if isinstance(col, tuple) else col for col in df.columns]
-        stats_to_save = []
-
-        for index, row in df.iterrows():
-            if pd.isna(row['Statistic']) or row['Statistic'] == 'Statistic':
-                continue      
-            # Build a tuple for each row
-            stats_to_save.append((
-                id, 
-                report_name, 
-                tab_name, 
-                row['Statistic'], 
-                row['Per 90'], 
-                row['Percentile']
-            ))
+        # one parse of the page gives the preset tab and the rows to insert
+        tab_name , stats_to_save = get_scout_report_stats(report_url, id, report_name)
         insert_player_stat(stats_to_save)
         time.sleep(5)
 
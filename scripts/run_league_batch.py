@@ -0,0 +1,37 @@
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.append(str(BASE_DIR))
+
+from src.league_batch import DEFAULT_BUDGET_RATIO, run_league_batch
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Best XI for every club in teams_fifa23.csv")
+    # a directory is a columnar pool (scripts/export_player_pool.py), shared by the workers
+    parser.add_argument('--players', default=BASE_DIR / "data" / "final_squad_cleaned.json")
+    parser.add_argument('--teams', default=BASE_DIR / "data" / "Fifa_2023" / "teams_fifa23.csv")
+    parser.add_argument('--out', default=BASE_DIR / "data" / "league_best_xi.csv")
+    # formations with role limits in SquadMILPSolver._get_formation_constraints
+    parser.add_argument('--formation', default="4-3-3", choices=["4-3-3"])
+    parser.add_argument('--style', default="attack", choices=["attack", "defend"])
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--budget-ratio', type=float, default=DEFAULT_BUDGET_RATIO,
+                        help="XI wage cap as a share of the club's wage bill")
+    args = parser.parse_args()
+
+    players = args.players
+    if not Path(players).is_dir():
+        players = pd.read_json(players, orient='records')
+    teams = pd.read_csv(args.teams)
+    formation = (*map(int, args.formation.split("-")), 1)  # always add GK
+
+    results, stats = run_league_batch(players, teams, formation=formation, style=args.style,
+                                      workers=args.workers, budget_ratio=args.budget_ratio)
+    results.to_csv(args.out, index=False)
+    print(f"{stats['solved']}/{stats['clubs']} clubs solved in {stats['seconds']:.1f}s "
+          f"({stats['clubs_per_second']:.1f} clubs/s) -> {args.out}")
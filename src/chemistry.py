@@ -0,0 +1,172 @@
+import heapq
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import pulp as pl
+
+from src.milp_solver import SquadMILPSolver
+
+# the FIFA pool and the scraped DB name the same fields differently
+CLUB_KEYS = ('Club', 'club')
+NATION_KEYS = ('Nationality', 'nationality')
+FOOT_KEYS = ('PreferredFoot', 'strong_foot')
+
+LEFT_ROLES = {'LB', 'LWB', 'LM', 'LW', 'LF'}
+RIGHT_ROLES = {'RB', 'RWB', 'RM', 'RW', 'RF'}
+
+
+def _field(p, keys):
+    for key in keys:
+        value = p.get(key)
+        if value not in (None, '', 'N/A'):
+            return value
+    return None
+
+
+def build_pair_graph(players: List[Dict], top_k: int = 5, club_bonus: float = 1.0,
+                     nation_bonus: float = 0.5) -> Dict[Tuple[str, str], float]:
+    """Sparse chemistry graph: (name_a, name_b) -> bonus for fielding both
+
+    Only pairs sharing a club or a nation are considered and every player
+    keeps its `top_k` best partners (highest bonus, then highest rating), so
+    the graph has at most `top_k` * len(players) edges. Candidate partners are
+    taken from the head of each club / nation group, never from all pairs.
+    """
+    best_rating = {p['Name']: max(p['rating_per_roles'].values()) for p in players}
+    affiliation = {p['Name']: (_field(p, CLUB_KEYS), _field(p, NATION_KEYS)) for p in players}
+    groups = defaultdict(list)
+    for name, (club, nation) in affiliation.items():
+        if club is not None:
+            groups[('club', club)].append(name)
+        if nation is not None:
+            groups[('nation', nation)].append(name)
+    # keep only the best rated top_k + 1 of every group as candidate partners
+    heads = {key: sorted(members, key=lambda name: best_rating[name], reverse=True)[:top_k + 1]
+             for key, members in groups.items()}
+
+    edges = {}
+    for name, (club, nation) in affiliation.items():
+        candidates = set(heads.get(('club', club), [])) | set(heads.get(('nation', nation), []))
+        candidates.discard(name)
+        partners = []
+        for other in candidates:
+            other_club, other_nation = affiliation[other]
+            bonus = (club_bonus * (club is not None and club == other_club)
+                     + nation_bonus * (nation is not None and nation == other_nation))
+            partners.append((bonus, best_rating[other], other))
+        for bonus, _, other in sorted(partners, reverse=True)[:top_k]:
+            edges[tuple(sorted((name, other)))] = bonus
+    return edges
+
+
+def chemistry_shortlist(players: List[Dict], per_role: int) -> List[Dict]:
+    """Players that can realistically make the XI: for every role the
+    `per_role` best rated plus the `per_role` best rated per wage"""
+    by_role = defaultdict(list)
+    for p in players:
+        for r in p['PossiblePositions']:
+            rating = p['rating_per_roles'][r]
+            by_role[r].append((rating, rating / max(p['WageEUR'], 1), p['Name']))
+    keep = set()
+    for entries in by_role.values():
+        keep.update(e[2] for e in heapq.nlargest(per_role, entries))
+        keep.update(e[2] for e in heapq.nlargest(per_role, entries, key=lambda e: e[1]))
+    return [p for p in players if p['Name'] in keep]
+
+
+def flank_bonus(p: Dict, role: str, bonus: float) -> float:
+    """Strong foot on its own flank (left-footed LB, right-footed RW, ...)"""
+    foot = _field(p, FOOT_KEYS)
+    if foot is None:
+        return 0.0
+    foot = str(foot).lower()
+    if (role in LEFT_ROLES and foot.startswith('left')) or (role in RIGHT_ROLES and foot.startswith('right')):
+        return bonus
+    return 0.0
+
+
+class ChemistrySquadSolver(SquadMILPSolver):
+    """Role-aware XI with a pairwise chemistry bonus on a sparse pair graph
+
+    For every edge (a, b) of the graph a continuous z[a,b] ∈ [0,1] is bounded
+    by the selection s[p] = Σ_r x[p,r] of both players. Bonuses are positive
+    and maximized, so only the upper McCormick inequalities are needed:
+        'mccormick':  z[a,b] <= s[a], z[a,b] <= s[b]       (2 per edge)
+        'aggregated': Σ_b z[a,b] <= deg(a) * s[a]         (1 per player)
+    Either way the model grows linearly with the pool (edges <= top_k * players),
+    but the LP relaxation of the pair terms is weak and CBC's solve time on the
+    full graph grows much faster (tens of seconds to minutes at 1.5k players
+    with a binding budget).
+    By default the graph is therefore restricted to a per-role shortlist of
+    players who can realistically start (see `chemistry_shortlist`); everyone
+    else stays selectable, just without a pair bonus. This is a heuristic: it
+    keeps the number of z variables independent of the pool size, but can
+    miss the full graph's optimum when the budget binds and the cheaper
+    players outside the shortlist would have formed pairs (see
+    scripts/benchmark_chemistry.py). Results report which graph was used in
+    'chemistry_scope' ('shortlist' or 'full') and 'chemistry_players'.
+    `shortlist_per_role=None` builds the exact graph over the whole pool.
+    The foot/flank fit depends on the role, not on the pair, so it is added as
+    a linear per (player, role) bonus instead of a pair term.
+    """
+
+    def __init__(self, *args, top_k: int = 5, club_bonus: float = 1.0, nation_bonus: float = 0.5,
+                 flank_bonus: float = 0.5, linearization: str = 'mccormick',
+                 shortlist_per_role: int = 25, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.top_k = top_k
+        self.club_bonus = club_bonus
+        self.nation_bonus = nation_bonus
+        self.flank_bonus = flank_bonus
+        self.linearization = linearization
+        self.shortlist_per_role = shortlist_per_role  # None: pair graph over the whole pool
+        self.pairs = {}
+        self.z = {}
+        self.pair_pool_size = 0
+
+    def _selected(self, name):
+        return pl.lpSum(self.x[(name, r)] for r in self.roles_of[name])
+
+    def build_variables(self):
+        super().build_variables()
+        self.roles_of = {p['Name']: p['PossiblePositions'] for p in self.players}
+        pair_pool = self.players
+        if self.shortlist_per_role is not None:
+            pair_pool = chemistry_shortlist(self.players, self.shortlist_per_role)
+        self.pairs = build_pair_graph(pair_pool, self.top_k, self.club_bonus, self.nation_bonus)
+        self.pair_pool_size = len(pair_pool)
+        self.z = {(a, b): pl.LpVariable(f"z_{a}_{b}", lowBound=0, upBound=1)
+                  for (a, b) in self.pairs}
+
+    def build_objective(self):
+        self.model += (pl.lpSum((p["rating_per_roles"][r] + flank_bonus(p, r, self.flank_bonus))
+                                * self.x[(p["Name"], r)]
+                                for p in self.players
+                                for r in p["PossiblePositions"])
+                       + pl.lpSum(bonus * self.z[pair] for pair, bonus in self.pairs.items()))
+
+    def build_constraints(self):
+        super().build_constraints()
+        if self.linearization == 'aggregated':
+            incident = defaultdict(list)
+            for (a, b), z in self.z.items():
+                incident[a].append(z)
+                incident[b].append(z)
+            for name, zs in incident.items():
+                self.model += pl.lpSum(zs) <= len(zs) * self._selected(name)
+        else:
+            for (a, b), z in self.z.items():
+                self.model += z <= self._selected(a)
+                self.model += z <= self._selected(b)
+
+    def extract_solution(self):
+        results = super().extract_solution()
+        if results['status'] == 'Optimal':
+            results['chemistry_pairs'] = [{'pair': pair, 'bonus': self.pairs[pair]}
+                                          for pair, z in self.z.items()
+                                          if z.value() is not None and z.value() > 0.5]
+            results['chemistry'] = sum(p['bonus'] for p in results['chemistry_pairs'])
+            # the shortlisted graph is a heuristic, say so next to the objective
+            results['chemistry_scope'] = 'full' if self.shortlist_per_role is None else 'shortlist'
+            results['chemistry_players'] = self.pair_pool_size
+        return results
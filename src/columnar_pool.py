@@ -0,0 +1,169 @@
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# nested fields of final_squad_cleaned.json, stored as a dense player x role layout
+ROLE_FIELDS = ('PossiblePositions', 'GlobalPos', 'rating_per_roles')
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+
+def export_columnar(player_info: List[Dict], out_dir: Path) -> Path:
+    """Write the player pool as one .npy file per column plus a string table
+
+        name.npy        fixed width unicode, one entry per player
+        <column>.npy    numeric columns (Age, WageEUR, Overall, ...)
+        <column>.npy    int32 codes into meta.json["strings"][column] (-1 = missing)
+        ratings.npy     float64 players x roles, rating_per_roles (exact round trip)
+        mask.npy        bool players x roles, role in PossiblePositions
+        lines.npy       int8 players x roles, index into meta.json["lines"] (GlobalPos)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    roles = sorted({r for p in player_info for r in p['PossiblePositions']})
+    lines = sorted({p['GlobalPos'][r] for p in player_info for r in p['PossiblePositions']})
+    role_idx = {r: j for j, r in enumerate(roles)}
+    line_idx = {l: k for k, l in enumerate(lines)}
+
+    n = len(player_info)
+    ratings = np.zeros((n, len(roles)), dtype=np.float64)
+    mask = np.zeros((n, len(roles)), dtype=bool)
+    line_codes = np.full((n, len(roles)), -1, dtype=np.int8)
+    for i, p in enumerate(player_info):
+        for r in p['PossiblePositions']:
+            j = role_idx[r]
+            mask[i, j] = True
+            ratings[i, j] = p['rating_per_roles'][r]
+            line_codes[i, j] = line_idx[p['GlobalPos'][r]]
+    np.save(out_dir / "ratings.npy", ratings)
+    np.save(out_dir / "mask.npy", mask)
+    np.save(out_dir / "lines.npy", line_codes)
+    np.save(out_dir / "name.npy", np.array([p['Name'] for p in player_info], dtype=str))
+
+    # flat scalar columns: numbers as arrays, strings as codes into a table
+    numeric, strings = [], {}
+    for column in player_info[0]:
+        if column in ROLE_FIELDS or column == 'Name':
+            continue
+        values = [p.get(column) for p in player_info]
+        present = [v for v in values if v is not None]
+        if present and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+            dtype = np.int64 if all(isinstance(v, int) for v in values) else np.float64
+            np.save(out_dir / f"{column}.npy",
+                    np.array([np.nan if v is None else v for v in values], dtype=dtype))
+            numeric.append(column)
+        elif present and all(isinstance(v, str) for v in present):
+            table = sorted(set(present))
+            code_of = {s: c for c, s in enumerate(table)}
+            np.save(out_dir / f"{column}.npy",
+                    np.array([code_of.get(v, -1) for v in values], dtype=np.int32))
+            strings[column] = table
+        # lists / dicts other than the role fields are not part of the pool format
+
+    with open(out_dir / META_FILE, "w") as f:
+        json.dump({'version': FORMAT_VERSION, 'n_players': n, 'roles': roles, 'lines': lines,
+                   'numeric': numeric, 'strings': strings}, f)
+    return out_dir
+
+
+class ColumnarPlayerPool:
+    """Player pool loaded from `export_columnar` output
+
+    Arrays are memory mapped (read-only) by default, so worker processes
+    opening the same directory share the page cache instead of each holding
+    a parsed copy. `SquadMILPSolver` builds its model from `role_entries`
+    directly; `to_records` (the list-of-dicts layout) is only for code that
+    needs per-player dicts.
+    """
+
+    def __init__(self, directory: Path, mmap: bool = True):
+        self.directory = Path(directory)
+        with open(self.directory / META_FILE) as f:
+            self.meta = json.load(f)
+        if self.meta['version'] != FORMAT_VERSION:
+            raise ValueError(f"unsupported player pool format version {self.meta['version']}")
+        mode = 'r' if mmap else None
+
+        def load(name):
+            return np.load(self.directory / f"{name}.npy", mmap_mode=mode)
+
+        self.roles = self.meta['roles']
+        self.lines = self.meta['lines']
+        self.ratings = load("ratings")
+        self.mask = load("mask")
+        self.line_codes = load("lines")
+        self.names = load("name")
+        self.columns = {column: load(column)
+                        for column in self.meta['numeric'] + list(self.meta['strings'])}
+        self._records = None
+
+    def __len__(self):
+        return self.meta['n_players']
+
+    def subset(self, rows) -> 'ColumnarPlayerPool':
+        """Pool restricted to `rows` (e.g. one club), sharing meta and string tables"""
+        rows = np.asarray(rows)
+        view = object.__new__(ColumnarPlayerPool)
+        view.directory = self.directory
+        view.meta = dict(self.meta, n_players=len(rows))
+        view.roles = self.roles
+        view.lines = self.lines
+        view.ratings = self.ratings[rows]
+        view.mask = self.mask[rows]
+        view.line_codes = self.line_codes[rows]
+        view.names = self.names[rows]
+        view.columns = {name: values[rows] for name, values in self.columns.items()}
+        view._records = None
+        return view
+
+    def role_entries(self):
+        """Every valid (player, role) cell of the mask in row order:
+        (rows, names, roles, lines, ratings) as arrays"""
+        rows, cols = np.nonzero(self.mask)
+        roles = np.array(self.roles)[cols]
+        lines = np.array(self.lines)[self.line_codes[rows, cols]]
+        return rows, np.asarray(self.names)[rows], roles, lines, np.asarray(self.ratings[rows, cols])
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of a scalar column, strings decoded from the string table"""
+        values = self.columns[name]
+        if name in self.meta['strings']:
+            table = np.array(self.meta['strings'][name] + [None], dtype=object)
+            return table[values]  # code -1 picks the trailing None
+        return np.asarray(values)
+
+    def to_records(self) -> List[Dict]:
+        if self._records is not None:
+            return self._records
+        rows, cols = np.nonzero(self.mask)
+        ratings = self.ratings[rows, cols].tolist()
+        line_codes = self.line_codes[rows, cols].tolist()
+        bounds = np.searchsorted(rows, np.arange(len(self) + 1)).tolist()
+        scalars = {name: self.column(name).tolist() for name in self.columns}
+        names = self.names.tolist()
+        records = []
+        for i in range(len(self)):
+            record = {'Name': names[i]}
+            for name, values in scalars.items():
+                record[name] = values[i]
+            start, end = bounds[i], bounds[i + 1]
+            roles = [self.roles[j] for j in cols[start:end].tolist()]
+            record['PossiblePositions'] = roles
+            record['GlobalPos'] = {r: self.lines[k] for r, k in zip(roles, line_codes[start:end])}
+            record['rating_per_roles'] = dict(zip(roles, ratings[start:end]))
+            records.append(record)
+        self._records = records
+        return records
+
+    def to_frame(self) -> pd.DataFrame:
+        """Scalar columns plus PossiblePositions, what the app's player search needs"""
+        df = pd.DataFrame({'Name': np.asarray(self.names)})
+        for name in self.columns:
+            df[name] = self.column(name)
+        mask = np.asarray(self.mask)
+        roles = np.array(self.roles, dtype=object)
+        df['PossiblePositions'] = [roles[row].tolist() for row in mask]
+        return df
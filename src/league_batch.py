@@ -0,0 +1,132 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pulp as pl
+
+from src.columnar_pool import ColumnarPlayerPool
+from src.milp_solver import SquadMILPSolver
+
+# share of a club's wage bill its XI may cost: an unconstrained best XI takes
+# about 70% of the bill, so 0.5 makes clubs trade rating against wages
+DEFAULT_BUDGET_RATIO = 0.5
+
+
+def partition_by_club(players: pd.DataFrame, clubs) -> Dict[str, List[Dict]]:
+    """Split the pool into per-club player records with a single group-by"""
+    players = players[players['Club'].isin(set(clubs))]
+    return {club: group.to_dict(orient='records') for club, group in players.groupby('Club', sort=False)}
+
+
+def partition_columnar(pool: ColumnarPlayerPool, clubs) -> Dict[str, np.ndarray]:
+    """Row indices of every club in a columnar pool, from one sort of the club codes"""
+    table = pool.meta['strings']['Club']
+    codes = np.asarray(pool.columns['Club'])
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(table) + 1))
+    code_of = {club: code for code, club in enumerate(table)}
+    return {club: order[bounds[code_of[club]]:bounds[code_of[club] + 1]]
+            for club in clubs if club in code_of}
+
+
+@lru_cache(maxsize=None)
+def _worker_pool(directory: str) -> ColumnarPlayerPool:
+    # each worker maps the shared directory once, pages are shared between workers
+    return ColumnarPlayerPool(directory)
+
+
+def club_budget(squad, budget_ratio: float = DEFAULT_BUDGET_RATIO) -> int:
+    """Wage cap of a club's XI: `budget_ratio` times the squad's wage bill
+
+    TransferBudget in teams_fifa23.csv is a transfer fee budget, not wages,
+    and the full wage bill never binds an XI picked from the same squad.
+    """
+    if isinstance(squad, ColumnarPlayerPool):
+        wage_bill = squad.column('WageEUR').sum()
+    else:
+        wage_bill = sum(p['WageEUR'] for p in squad)
+    return int(budget_ratio * wage_bill)
+
+
+def _squad_size(squad) -> int:
+    return len(squad[1]) if isinstance(squad, tuple) else len(squad)
+
+
+def solve_club(args: Tuple) -> Dict:
+    """Best role-aware XI of one club; top level so worker processes can pickle it
+
+    `squad` is either the club's player records or (pool directory, row indices)
+    into a columnar pool, which the worker opens itself instead of receiving
+    pickled records. A failing club gets an 'Error' row instead of ending the run.
+    """
+    team, squad, formation, style, budget_ratio = args
+    start = time.perf_counter()
+    try:
+        if isinstance(squad, tuple):
+            directory, rows = squad
+            squad = _worker_pool(directory).subset(rows)
+        budget = club_budget(squad, budget_ratio)
+        solver = SquadMILPSolver(squad, formation=formation, age=None, total_budget=budget,
+                                 playing_style=style, locked_players={}, total_players=11,
+                                 role_aware=True)
+        results = solver.solve(pl.PULP_CBC_CMD(msg=0))
+    except Exception as e:
+        return {'Club': team['Name'],
+                'LeagueId': team['LeagueId'],
+                'Players': _squad_size(squad),
+                'Status': 'Error',
+                'Error': f"{type(e).__name__}: {e}",
+                'SolveTime': time.perf_counter() - start}
+    row = {'Club': team['Name'],
+           'LeagueId': team['LeagueId'],
+           'Players': len(squad),
+           'Budget': budget,
+           'Status': results['status'],
+           'SolveTime': time.perf_counter() - start}
+    if results['status'] == 'Optimal':
+        row.update({'Score': results['objective'],
+                    'Wage': results['total_budget'],
+                    'AverageAge': results['average age'],
+                    'XI': '; '.join(f"{p['Name']} ({p['role']})" for p in results['selected_players'])})
+    return row
+
+
+def run_league_batch(players, teams: pd.DataFrame, formation=(4, 3, 3, 1),
+                     style: str = 'attack', workers: int = None,
+                     budget_ratio: float = DEFAULT_BUDGET_RATIO) -> Tuple[pd.DataFrame, Dict]:
+    """Best XI for every club in `teams`, solved in parallel across cores
+
+    `players` is a DataFrame of player records or the directory of a columnar
+    pool (src/columnar_pool.py); with a directory only row indices are sent to
+    the workers, which memory map the same files. Every XI is capped at
+    `budget_ratio` times its club's wage bill (see `club_budget`).
+    Returns the per-club results table and the run stats (clubs, seconds,
+    clubs per second).
+    """
+    start = time.perf_counter()
+    if isinstance(players, (str, Path)):
+        directory = str(players)
+        rows = partition_columnar(ColumnarPlayerPool(directory), teams['Name'])
+        squads = {club: (directory, club_rows) for club, club_rows in rows.items()}
+    else:
+        squads = partition_by_club(players, teams['Name'])
+    jobs = [(team, squads.get(team['Name'], []), formation, style, budget_ratio)
+            for team in teams.to_dict(orient='records')]
+    # clubs without any player in the pool cannot field an XI
+    empty = [{'Club': team['Name'], 'LeagueId': team['LeagueId'], 'Players': 0,
+              'Status': 'NoPlayers'} for team, squad, *_ in jobs if _squad_size(squad) < 11]
+    jobs = [job for job in jobs if _squad_size(job[1]) >= 11]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        rows = list(pool.map(solve_club, jobs, chunksize=4))
+
+    elapsed = time.perf_counter() - start
+    results = pd.DataFrame(rows + empty)
+    stats = {'clubs': len(teams), 'solved': int((results['Status'] == 'Optimal').sum()),
+             'seconds': elapsed, 'clubs_per_second': len(teams) / elapsed}
+    return results, stats
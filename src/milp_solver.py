@@ -4,9 +4,12 @@ import sys
 from pathlib import Path
 # import pandas as pd
 import json 
+from functools import lru_cache
+import numpy as np
 BASE_DIR = Path(__file__).resolve().parents[1]
 
 sys.path.append(str(BASE_DIR))
+from src.columnar_pool import ColumnarPlayerPool
 
 class SquadMILPSolver:
     def __init__(
@@ -20,7 +23,10 @@ class SquadMILPSolver:
         total_players: int = 11,
         role_aware: bool = True):
 
-        self.players = player_info
+        # columnar pools (src/columnar_pool.py) are read straight from their
+        # arrays; per-player dicts are only built if something asks for self.players
+        self.columnar = player_info if isinstance(player_info, ColumnarPlayerPool) else None
+        self._players = None if self.columnar is not None else player_info
         self.players_pre_selected = locked_players
         self.avg_age = age
         self.formation = formation
@@ -33,6 +39,19 @@ class SquadMILPSolver:
         self.locked_players = locked_players
 
         # self.playting_styles = {''}
+    @property
+    def players(self):
+        if self._players is None:
+            self._players = self.columnar.to_records()
+        return self._players
+
+    @players.setter
+    def players(self, player_info):
+        self._players = player_info
+
+    def _use_columnar(self):
+        return self.columnar is not None and self.role_aware
+
     def _get_formation_constraints(self,formation,style):
         formation_styles=  {( (4,3,3), 'attack'): {
                             'CAM': (1, 2),  # (min, max)
@@ -69,7 +88,60 @@ class SquadMILPSolver:
 
         return formation_styles[(formation,style)],style_weights[style]                             
         
+    def _build_columnar_variables(self):
+        # one entry per valid (player, role) cell of the mask, in row order
+        rows, names, roles, lines, ratings = self.columnar.role_entries()
+        self._rows = rows
+        self._names = names
+        self._roles = roles
+        self._lines = lines
+        self._ratings = ratings
+        self._wages = self.columnar.column('WageEUR')[rows]
+        self._ages = self.columnar.column('Age')[rows]
+        # named by row, FIFA short names repeat ("Vitinha", "Danilo")
+        self._vars = [pl.LpVariable(f"x_{i}_{r}", cat="Binary") for i, r in zip(rows.tolist(), roles.tolist())]
+        # (name, role) -> variable for locked players and subclasses, first player of a repeated name
+        self.x = {}
+        for key, var in zip(zip(names.tolist(), roles.tolist()), self._vars):
+            self.x.setdefault(key, var)
+
+    def _columnar_sum(self, idx, coefficients=None):
+        # linear expression over the entries idx, built without per-player dicts
+        if coefficients is None:
+            return pl.LpAffineExpression([(self._vars[k], 1) for k in idx.tolist()])
+        return pl.LpAffineExpression([(self._vars[k], c) for k, c in zip(idx.tolist(), coefficients[idx].tolist())])
+
+    def _build_columnar_constraints(self):
+        everyone = np.arange(len(self._vars))
+        # total players
+        self.model += self._columnar_sum(everyone) == self.total_players
+        # each player at most one role (entries are grouped by player row)
+        bounds = np.flatnonzero(np.diff(self._rows)) + 1
+        for idx in np.split(everyone, bounds):
+            if len(idx) > 1:
+                self.model += self._columnar_sum(idx) <= 1
+        formation= self.formation[:3]
+        formation_constraints,_ = self._get_formation_constraints(formation,self.style)
+        for position,limits in formation_constraints.items():
+            idx = np.flatnonzero(self._roles == position)
+            self.model += self._columnar_sum(idx) >= limits[0]
+            self.model += self._columnar_sum(idx) <= limits[1]
+        #formation
+        for gb_role,required in zip(['DF','MF','FW' , 'GK'], self.formation):
+            self.model += self._columnar_sum(np.flatnonzero(self._lines == gb_role)) == required
+        # budget
+        self.model += self._columnar_sum(everyone, self._wages) <= self.budget
+        # age: same effect as the per-entry age constraints, players outside the range are fixed to 0
+        if self.avg_age is not None:
+            outside = np.flatnonzero((self._ages < self.avg_age[0]) | (self._ages > self.avg_age[1]))
+            locked = set(self.locked_players.keys())
+            for k in outside.tolist():
+                if self._names[k] not in locked:
+                    self._vars[k].upBound = 0
+
     def build_variables(self):
+        if self._use_columnar():
+            return self._build_columnar_variables()
         if not self.role_aware:
             # x[player] ∈ {0,1}
             self.x = {p["Name"]: pl.LpVariable(f"x_{p['Name']}", cat="Binary")
@@ -81,6 +153,9 @@ class SquadMILPSolver:
                 for r in p["PossiblePositions"]}
 
     def build_objective(self):
+        if self._use_columnar():
+            self.model += self._columnar_sum(np.arange(len(self._vars)), self._ratings)
+            return
         if not self.role_aware:
             self.model += pl.lpSum(p["Overall"] * self.x[p["Name"]] for p in self.players)
         else:
@@ -102,7 +177,9 @@ class SquadMILPSolver:
             # for name,role in self.locked_players.items():
             #     self.model+= ( self.x[(name,role)]) == 1
 
-        if not self.role_aware:
+        if self._use_columnar():
+            self._build_columnar_constraints()
+        elif not self.role_aware:
             # total players
             self.model += pl.lpSum(self.x[p["Name"]] for p in self.players) == self.total_players
             # formation
@@ -146,11 +223,12 @@ class SquadMILPSolver:
                 # for p in self.players for r in p['PossiblePositions'] if p['Name'] not in self.locked_players.keys()  )
 
 
-    def solve(self):
+    def solve(self, solver=None):
         self.build_variables()
         self.build_objective()
         self.build_constraints()
-        self.model.solve()
+        # solver: optional pulp solver (e.g. pl.PULP_CBC_CMD(msg=0)), default CBC otherwise
+        self.model.solve(solver)
         return self.extract_solution()
 
     def extract_solution(self):
@@ -162,7 +240,11 @@ class SquadMILPSolver:
                     }
         else:
             selected = []
-            if not self.role_aware:
+            if self._use_columnar():
+                # from the chosen entries, self.x drops repeated names
+                chosen = [k for k, var in enumerate(self._vars) if var.value() == 1]
+                selected = [{"Name": self._names[k].item(), "role": self._roles[k].item()} for k in chosen]
+            elif not self.role_aware:
                 for p in self.players:
                     if self.x[p["Name"]].value() == 1:
                         selected.append({"Name": p["Name"],
@@ -179,13 +261,21 @@ class SquadMILPSolver:
             budget = 0 
             age = 0
 
-            for player_info in selected:  # Only 11 players
-                # Find the full player data
-                p = next(p for p in self.players if p['Name'] == player_info['Name'])
-                player_info['Rating'] = p['Overall']
-                player_info['WageEur'] = p['WageEUR']
-                budget += p['WageEUR']
-                age += p['Age']
+            if self._use_columnar():
+                overall = self.columnar.column('Overall')
+                for player_info, k in zip(selected, chosen):
+                    player_info['Rating'] = overall[self._rows[k]].item()
+                    player_info['WageEur'] = self._wages[k].item()
+                    budget += self._wages[k].item()
+                    age += self._ages[k].item()
+            else:
+                for player_info in selected:  # Only 11 players
+                    # Find the full player data
+                    p = next(p for p in self.players if p['Name'] == player_info['Name'])
+                    player_info['Rating'] = p['Overall']
+                    player_info['WageEur'] = p['WageEUR']
+                    budget += p['WageEUR']
+                    age += p['Age']
             avg_age = age/len(selected)
             
             return {"status": pl.LpStatus[self.model.status],
@@ -195,12 +285,25 @@ class SquadMILPSolver:
                 'average age': avg_age }
 
 
-def optimize_squad(budget,formation,style,age,locked_players):
+@lru_cache(maxsize=None)
+def _open_columnar_pool(directory):
+    # opened once per process, the arrays stay memory mapped
+    return ColumnarPlayerPool(directory)
+
 
-    player_data_file = BASE_DIR /"data"/"final_squad_cleaned.json"
+def optimize_squad(budget,formation,style,age,locked_players,player_squad=None):
 
-    with open(player_data_file, "r") as f:
-        player_squad = json.load(f)    
+    # callers holding a shared pool (see src/player_pool.py) pass it in,
+    # otherwise the columnar pool is opened once, or the JSON read on every call
+    if player_squad is None:
+        columnar_dir = BASE_DIR /"data"/"final_squad_cleaned"
+        player_data_file = BASE_DIR /"data"/"final_squad_cleaned.json"
+
+        if columnar_dir.is_dir():
+            player_squad = _open_columnar_pool(columnar_dir)
+        else:
+            with open(player_data_file, "r") as f:
+                player_squad = json.load(f)    
     sqsolve = SquadMILPSolver(player_squad,formation=formation,total_players=11,total_budget=budget,playing_style=style,age=age,locked_players=locked_players)
     results = sqsolve.solve()
     return results
\ No newline at end of file
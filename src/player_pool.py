@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import List
+
+import pandas as pd
+
+from src.columnar_pool import ColumnarPlayerPool
+
+
+class PlayerPool:
+    """Read-only, indexed view of the player pool, built once per process
+
+    `records` is what the MILP solver consumes (a tuple of read-only dicts,
+    or the memory mapped ColumnarPlayerPool itself), `df` is indexed by
+    player name for fast lookups in the UI.
+    """
+
+    def __init__(self, player_info, df: pd.DataFrame = None):
+        if isinstance(player_info, ColumnarPlayerPool):
+            # the solver reads the mapped arrays directly, no per-player dicts
+            self.records = player_info
+            if df is None:
+                df = player_info.to_frame()
+        else:
+            # read-only records so a shared pool cannot be mutated by one session
+            self.records = tuple(MappingProxyType(p) for p in player_info)
+            if df is None:
+                df = pd.DataFrame(player_info)
+        self.df = df.set_index('Name', drop=False)
+        self.nationalities = sorted(self.df['Nationality'].unique())
+        # nationality -> sorted player names, the only filter the app needs
+        self._names_by_country = {country: sorted(group['Name'].tolist())
+                                  for country, group in self.df.groupby('Nationality')}
+
+    def __len__(self):
+        return len(self.records)
+
+    def players_by_country(self, country: str) -> List[str]:
+        return self._names_by_country.get(country, [])
+
+    def player(self, name: str) -> pd.Series:
+        row = self.df.loc[name]
+        # duplicated names return a frame, keep the first like the old lookup
+        return row.iloc[0] if isinstance(row, pd.DataFrame) else row
+
+    def memory_bytes(self) -> int:
+        return int(self.df.memory_usage(deep=True).sum())
+
+
+def load_player_pool(player_data_file: Path) -> PlayerPool:
+    # a directory is the columnar format written by src.columnar_pool.export_columnar
+    if Path(player_data_file).is_dir():
+        return PlayerPool(ColumnarPlayerPool(player_data_file))
+    with open(player_data_file, "r") as f:
+        player_squad = json.load(f)
+    return PlayerPool(player_squad)
@@ -0,0 +1,208 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pulp as pl
+import sqlite3
+
+from src.columnar_pool import ColumnarPlayerPool
+from src.milp_solver import SquadMILPSolver
+
+
+def load_percentile_spread(db_path=None, name_map: Dict[str, str] = None) -> Dict[str, float]:
+    """Per-player rating uncertainty from the scout reports: spread (std) of the
+    stat percentiles, scaled to a fraction (a player with very uneven
+    percentiles gets a less reliable PCA role rating)
+
+    The DB is keyed by FBref names and shares no player key with the FIFA
+    pool, so `name_map` (FBref name -> pool name) translates them; unmapped
+    names are kept as they are. Check the match with `spread_coverage`.
+    """
+    if db_path is None:
+        from src.database import DB_PATH
+        db_path = DB_PATH
+    conn = sqlite3.connect(db_path)
+    df = pd.read_sql('''SELECT p.name, s.percentile FROM player_stats s
+                        JOIN players p ON p.player_id = s.player_id''', conn)
+    conn.close()
+    spreads = (df.groupby('name')['percentile'].std() / 100).fillna(0).to_dict()
+    name_map = name_map or {}
+    return {name_map.get(name, name): spread for name, spread in spreads.items()}
+
+
+def _role_ratings(players) -> Dict[Tuple[str, str], float]:
+    """(name, role) -> rating of player records or a ColumnarPlayerPool,
+    the first player of a repeated name like the solver's x"""
+    if isinstance(players, ColumnarPlayerPool):
+        _, names, roles, _, values = players.role_entries()
+        entries = zip(zip(names.tolist(), roles.tolist()), values.tolist())
+    else:
+        entries = (((p['Name'], r), p['rating_per_roles'][r])
+                   for p in players for r in p['PossiblePositions'])
+    ratings = {}
+    for key, rating in entries:
+        ratings.setdefault(key, rating)
+    return ratings
+
+
+def spread_coverage(players, spreads: Dict[str, float]) -> Tuple[int, int]:
+    """(pool players with a spread, pool players): everyone else gets the default spread"""
+    names = players.names.tolist() if isinstance(players, ColumnarPlayerPool) else [p['Name'] for p in players]
+    return sum(name in spreads for name in names), len(names)
+
+
+def rating_deviations(players, spreads: Dict[str, float] = None,
+                      default_spread: float = 0.1) -> Dict[Tuple[str, str], float]:
+    """Max deviation of every (player, role) rating: |rating| * player spread"""
+    spreads = spreads or {}
+    return {(name, r): abs(rating) * spreads.get(name, default_spread)
+            for (name, r), rating in _role_ratings(players).items()}
+
+
+def scenario_matrix(nominal: np.ndarray, deviation: np.ndarray, n_scenarios: int,
+                    seed: int = 0) -> np.ndarray:
+    """S x V matrix of sampled ratings, each within nominal ± deviation"""
+    rng = np.random.default_rng(seed)
+    return nominal + deviation * rng.uniform(-1, 1, (n_scenarios, nominal.shape[0]))
+
+
+def evaluate_squads(selection: np.ndarray, scenarios: np.ndarray, alpha: float = 0.1):
+    """Score every candidate squad in every scenario in one matrix product
+
+    selection: C x V 0/1 matrix (candidate squads), scenarios: S x V.
+    Returns (scores S x C, worst case per squad, CVaR_alpha per squad).
+    """
+    scores = scenarios @ selection.T
+    tail = max(1, int(np.ceil(alpha * scores.shape[0])))
+    ordered = np.sort(scores, axis=0)
+    return scores, ordered[0], ordered[:tail].mean(axis=0)
+
+
+class RobustSquadSolver(SquadMILPSolver):
+    """Nominal squad model with ratings shrunk to r − max(d − θ, 0)
+
+    Bertsimas–Sim: with at most Γ of the selected ratings dropping by their
+    deviation d, the robust optimum of a 0-1 problem is
+
+        max_θ≥0 [ −Γ·θ + max_x Σ (r − max(d − θ, 0))·x ]
+
+    so it is found by solving the plain nominal MILP for a handful of θ values
+    instead of the compact robust counterpart, whose weak LP relaxation makes
+    CBC crawl on large pools. θ = 0 is the full worst case, θ ≥ max(d) the
+    nominal squad.
+    """
+
+    def __init__(self, *args, deviations: Dict = None, theta: float = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deviations = deviations or {}
+        self.theta = theta
+
+    def build_objective(self):
+        if self._use_columnar():
+            shrink = np.array([max(self.deviations.get((n, r), 0) - self.theta, 0)
+                               for n, r in zip(self._names.tolist(), self._roles.tolist())])
+            self.model += self._columnar_sum(np.arange(len(self._vars)), self._ratings - shrink)
+            return
+        self.model += pl.lpSum((p["rating_per_roles"][r]
+                                - max(self.deviations.get((p["Name"], r), 0) - self.theta, 0))
+                               * self.x[(p["Name"], r)]
+                               for p in self.players
+                               for r in p["PossiblePositions"])
+
+
+def budgeted_robust_value(squad, ratings: Dict, deviations: Dict, gamma: int) -> float:
+    """Score of a squad when its `gamma` most uncertain ratings hit their worst case"""
+    drops = sorted((deviations.get(key, 0) for key in squad), reverse=True)
+    return sum(ratings[key] for key in squad) - sum(drops[:gamma])
+
+
+class RobustSquadSelector:
+    """Robust squad selection under rating uncertainty
+
+    Candidate squads come from the θ-decomposition of the Bertsimas–Sim model
+    (`n_thetas` nominal solves, θ on the quantiles of the deviations). All
+    candidates are then scored against `n_scenarios` sampled rating scenarios
+    in one vectorized pass and the squad with the best scenario CVaR, scenario
+    worst case or budgeted (Γ = `gamma`) robust value is returned.
+    """
+
+    def __init__(
+        self,
+        player_info,  # player records or a ColumnarPlayerPool
+        formation: Tuple[int, int, int, int],
+        age: Tuple,
+        total_budget: int,
+        playing_style: str,
+        locked_players: Dict,
+        spreads: Dict[str, float] = None,  # name -> rating spread, see load_percentile_spread
+        default_spread: float = 0.1,
+        gamma: int = 3,  # ratings allowed to hit their worst case at once
+        n_thetas: int = 6,
+        n_scenarios: int = 2000,
+        criterion: str = 'cvar',  # 'cvar', 'worst' or 'budgeted'
+        alpha: float = 0.1,
+        seed: int = 0):
+
+        self.players = player_info
+        self.solver_kwargs = dict(formation=formation, age=age, total_budget=total_budget,
+                                  playing_style=playing_style, locked_players=locked_players,
+                                  total_players=11, role_aware=True)
+        self.deviations = rating_deviations(player_info, spreads, default_spread)
+        # the DB covers few pool players, report how many did not fall back to the default
+        self.spread_matched, _ = spread_coverage(player_info, spreads or {})
+        self.gamma = gamma
+        self.n_thetas = n_thetas
+        self.n_scenarios = n_scenarios
+        self.criterion = criterion
+        self.alpha = alpha
+        self.seed = seed
+
+    def _thetas(self) -> List[float]:
+        # θ = 0 (full worst case) up to max deviation (nominal squad)
+        d = np.array([v for v in self.deviations.values() if v > 0])
+        if d.size == 0:
+            return [0.0]
+        return sorted(set(np.quantile(d, np.linspace(0, 1, self.n_thetas)).tolist()) | {0.0})
+
+    def solve(self, solver=None):
+        candidates = []
+        seen = set()
+        for theta in self._thetas():
+            results = RobustSquadSolver(self.players, deviations=self.deviations, theta=theta,
+                                        **self.solver_kwargs).solve(solver)
+            if results['status'] != 'Optimal':
+                return results
+            squad = frozenset((p['Name'], p['role']) for p in results['selected_players'])
+            if squad not in seen:
+                seen.add(squad)
+                results['theta'] = theta
+                candidates.append((squad, results))
+
+        # columns: only the (player, role) pairs used by some candidate
+        columns = sorted(set().union(*(squad for squad, _ in candidates)))
+        index = {key: i for i, key in enumerate(columns)}
+        ratings = _role_ratings(self.players)
+        nominal = np.array([ratings[key] for key in columns])
+        deviation = np.array([self.deviations.get(key, 0.0) for key in columns])
+        selection = np.zeros((len(candidates), len(columns)))
+        for c, (squad, _) in enumerate(candidates):
+            selection[c, [index[key] for key in squad]] = 1
+
+        scenarios = scenario_matrix(nominal, deviation, self.n_scenarios, self.seed)
+        scores, worst, cvar = evaluate_squads(selection, scenarios, self.alpha)
+        budgeted = np.array([budgeted_robust_value(squad, ratings, self.deviations, self.gamma)
+                             for squad, _ in candidates])
+        criteria = {'cvar': cvar, 'worst': worst, 'budgeted': budgeted}
+        best = int(np.argmax(criteria[self.criterion]))
+
+        summary = [{'theta': r['theta'], 'nominal': float(n), 'budgeted': float(b),
+                    'worst_case': float(w), 'cvar': float(v), 'expected': float(m)}
+                   for (_, r), n, b, w, v, m in zip(candidates, selection @ nominal, budgeted,
+                                                    worst, cvar, scores.mean(axis=0))]
+        results = candidates[best][1]
+        # the MILP objective used shrunk ratings, report the squad's real scores instead
+        results.update({k: v for k, v in summary[best].items() if k != 'theta'})
+        results['objective'] = results['nominal']
+        results['candidates'] = summary
+        results['spread_matched'] = self.spread_matched
+        return results
@@ -1,6 +1,7 @@
 from bs4 import BeautifulSoup as bs
 import requests
 from curl_cffi import requests
+import lxml.html
 import pandas as pd 
 import time 
 import io
@@ -52,47 +53,92 @@ def get_per_scout_report(scout_url):
     return current_group,df[0]
 
 
-def get_static_meta(player_name):
-    response = get_player_url(player_name) 
-    if '/players/' in response.url:
-        id = re.search(r'players/([a-z0-9]+)/', response.url).group(1)
-        soup = bs(response.text,'html.parser') 
-    else:
-        id,name,position,footed,height,weight,birth_date,birth_place,club,weekly_wage,currency=None,None,None,None,None,None,None,None,None,None,None
-    meta = soup.find('div', id='meta')
+# meta block patterns, compiled once and each run a single time per page
+PLAYER_ID_RE = re.compile(r'players/([a-z0-9]+)/')
+HEIGHT_RE = re.compile(r'(\d+)cm')
+WEIGHT_RE = re.compile(r'(\d+)kg')
+POSITION_RE = re.compile(r'Position:\s*(.*?)(?=\s*(?:\d{3}cm|[▪,]|Footed:|Born:|$))')
+FOOTED_RE = re.compile(r'Footed: (\w+)')
+BIRTH_DATE_RE = re.compile(r'([A-Z][a-z]+ \d{1,2}, \d{4})')
+WAGE_RE = re.compile(r'([￡$€])\s*([\d,]+)\s*(Weekly|Monthly|Yearly)')
+CLUB_RE = re.compile(r'Club:\s*(.*?)(?=\s*(?:Wages|Instagram|Contract|Expires|Born|$))')
+PRESET_XPATH = ("//div[contains(@class, 'filter') and contains(@class, 'switcher')]"
+                "//div[contains(@class, 'current')]//a[contains(@class, 'sr_preset')]")
+
+
+def _match(pattern, text, default="N/A"):
+    match = pattern.search(text)
+    return match.group(1) if match else default
+
+
+def _cell_value(text):
+    # same values pd.read_html produced: numbers as floats, '' as missing, the rest as text
+    text = text.strip()
+    if text == '':
+        return None
+    try:
+        return float(text.replace(',', ''))
+    except ValueError:
+        return text
+
+
+def parse_scout_page(html, player_id, report_name):
+    """Preset tab name and ready-to-insert player_stats tuples from one parse
+    of a scout report page (first table on the page, like pd.read_html()[0])"""
+    tree = lxml.html.fromstring(html)
+    preset = tree.xpath(PRESET_XPATH)
+    tab_name = preset[0].text_content().strip() if preset else 'N/A'
+
+    tables = tree.xpath('//table')
+    if not tables:
+        return tab_name, []
+    table = tables[0]
+    # the last header row holds the column names (Statistic, Per 90, Percentile)
+    header = [cell.text_content().strip() for cell in table.xpath('./thead/tr[last()]/*')]
+    stat_idx, per90_idx, pct_idx = (header.index(c) for c in ('Statistic', 'Per 90', 'Percentile'))
+
+    stats = []
+    for row in table.xpath('./tbody/tr'):
+        cells = [cell.text_content() for cell in row.xpath('./th|./td')]
+        if len(cells) <= max(stat_idx, per90_idx, pct_idx):
+            continue
+        statistic = cells[stat_idx].strip()
+        # blank spacer rows and repeated header rows
+        if not statistic or statistic == 'Statistic':
+            continue
+        stats.append((player_id, report_name, tab_name, statistic,
+                      _cell_value(cells[per90_idx]), _cell_value(cells[pct_idx])))
+    return tab_name, stats
+
+
+def get_scout_report_stats(scout_url, player_id, report_name):
+    response = requests.get(scout_url,impersonate='chrome',allow_redirects=True)
+    return parse_scout_page(response.text, player_id, report_name)
+
+
+def parse_player_meta(html, url):
+    """Static player data from the #meta block of a player page, one parse"""
+    tree = lxml.html.fromstring(html)
+    meta = tree.xpath("//div[@id='meta']")
     if not meta: return {}
-    raw_text = meta.get_text(separator=" ").replace('\xa0', ' ')
+    raw_text = " ".join(meta[0].itertext()).replace('\xa0', ' ')
     clean_text = " ".join(raw_text.split())
     # Remove the specific 'pt ' artifact that FBRef injects
     clean_text = clean_text.replace(" pt ", " ")
-    # 2. Extraction using targeted patterns
-    name = soup.find('h1').text.strip()
-    # Height/Weight (Digits before cm/kg)
-    height = re.search(r'(\d+)cm', clean_text).group(1) if re.search(r'(\d+)cm', clean_text) else "N/A"
-    weight = re.search(r'(\d+)kg', clean_text).group(1) if re.search(r'(\d+)kg', clean_text) else "N/A"
-    pos_match = re.search(r'Position:\s*(.*?)(?=\s*(?:\d{3}cm|[▪,]|Footed:|Born:|$))', clean_text)
-    footed = re.search(r'Footed: (\w+)',clean_text).group(1) if re.search(r'Footed: (\w+)', clean_text) else "N/A"
-    # match = re.search(r'Position:\s*(.*?)(?=\s*(?:[▪,]|Footed|Born|$))', clean_text)
-    position =  pos_match.group(1).strip().rstrip(',') if pos_match else 'N/A'
-    # Birth Date: Look for the pattern 'Month Day, Year'
-    # This avoids grabbing the location or the 'pt' artifacts
-    birth_date = "N/A"
-    date_match = re.search(r'([A-Z][a-z]+ \d{1,2}, \d{4})', clean_text)
-    if date_match:
-        birth_date = date_match.group(1)
-    # Birth Place: Find text between the Year and the next major label (National Team/Club)
+    h1 = tree.find('.//h1')
+
+    position = _match(POSITION_RE, clean_text)
+    position = position.strip().rstrip(',') if position != "N/A" else position
+    birth_date = _match(BIRTH_DATE_RE, clean_text)
     birth_place = "N/A"
     if birth_date != "N/A":
         # Capture everything after the date until we hit a known "Stop" word
-        place_pattern = re.escape(birth_date) + r'\s+in\s+(.*?)(?=National|Club|Born|$)'
-        place_match = re.search(place_pattern, clean_text)
+        place_match = re.search(re.escape(birth_date) + r'\s+in\s+(.*?)(?=National|Club|Born|$)', clean_text)
         if place_match:
             birth_place = place_match.group(1).replace("pt", "").strip()
-    # Pattern: Look for currency symbol, then digits/commas, then the word "Weekly"
-    wage_match = re.search(r'([￡$€])\s*([\d,]+)\s*(Weekly|Monthly|Yearly)', clean_text)    
+    wage_match = WAGE_RE.search(clean_text)
     if wage_match:
         currency = wage_match.group(1)
-        # Remove commas from the amount so it's a clean number for SQL
         amount = int(wage_match.group(2).replace(',', ''))
         frequency = wage_match.group(3)
         # Normalize all to Weekly
@@ -105,19 +151,15 @@ def get_static_meta(player_name):
     else:
         currency = "N/A"
         weekly_wage = 'N/A'
-    # Club: Extract specifically after 'Club:' and stop before Instagram
-    club_match = re.search(r'Club:\s*(.*?)(?=\s*(?:Wages|Instagram|Contract|Expires|Born|$))', clean_text)
-    if club_match:
-        club = club_match.group(1).strip().rstrip(':')
-    else:
-        club = "N/A"
+    club = _match(CLUB_RE, clean_text)
+    club = club.strip().rstrip(':') if club != "N/A" else club
     return {
-        'player_id':id,
-        'name': name,
+        'player_id': _match(PLAYER_ID_RE, url, default=None),
+        'name': h1.text_content().strip() if h1 is not None else "N/A",
         'position': position,
-        'strong_foot':  footed,
-        'height_cm': height,
-        'weight_kg': weight,
+        'strong_foot': _match(FOOTED_RE, clean_text),
+        'height_cm': _match(HEIGHT_RE, clean_text),
+        'weight_kg': _match(WEIGHT_RE, clean_text),
         'birth_date': birth_date,
         'birth_place': birth_place,
         'club': club,
@@ -126,3 +168,8 @@ def get_static_meta(player_name):
     }
 
 
+def get_static_meta(player_name):
+    response = get_player_url(player_name) 
+    if '/players/' not in response.url:
+        return {}
+    return parse_player_meta(response.text, response.url)
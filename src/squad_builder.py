@@ -0,0 +1,179 @@
+import heapq
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import pulp as pl
+
+from src.milp_solver import SquadMILPSolver
+
+# minimum bench players per line, e.g. a second GK and two backups per outfield line
+DEFAULT_BENCH_COVER = {'GK': 1, 'DF': 2, 'MF': 2, 'FW': 2}
+
+
+class MatchdaySquadSolver(SquadMILPSolver):
+    """Full matchday squad: the role-aware starting XI plus a bench with line cover
+
+    Both share one wage budget and are solved as one MILP. With
+    `prune_dominated=True` (default) the pool is reduced first:
+        1. drop every player who is dominated in all of their slots (each XI role
+           and each bench line): at least `squad size` eligible players are
+           no more expensive and rated at least as well in that slot
+        2. solve the joint XI + bench model over the remaining players
+    The reduction is exact: in any squad using a dropped player one of
+    their dominators is unused and can take the slot without losing rating or
+    breaking the budget (see scripts/benchmark_matchday_squad.py).
+    With `prune_dominated=False` the joint model is built over the full pool.
+    """
+
+    def __init__(
+        self,
+        player_info: List[Dict],
+        formation: Tuple[int, int, int, int],  # (DF, MF, FW, GK) of the XI
+        age: Tuple,  # (min,max)
+        total_budget: int,  # XI + bench
+        playing_style: str,
+        locked_players: Dict,
+        bench_size: int = 12,
+        bench_cover: Dict = None,  # line -> minimum bench players
+        bench_weight: float = 0.5,  # bench ratings count less than starters
+        prune_dominated: bool = True):
+
+        super().__init__(player_info, formation=formation, age=age, total_budget=total_budget,
+                         playing_style=playing_style, locked_players=locked_players,
+                         total_players=11, role_aware=True)
+        self.bench_size = bench_size
+        self.bench_cover = DEFAULT_BENCH_COVER if bench_cover is None else bench_cover
+        self.bench_weight = bench_weight
+        self.prune_dominated = prune_dominated
+        self.y = {}
+        self.bench_players = []
+
+    @staticmethod
+    def _line_ratings(p) -> Dict[str, float]:
+        # best role rating of a player for every line (DF/MF/FW/GK) it covers
+        ratings = {}
+        for r in p['PossiblePositions']:
+            line = p['GlobalPos'][r]
+            ratings[line] = max(ratings.get(line, float('-inf')), p['rating_per_roles'][r])
+        return ratings
+
+    def _bench_eligible(self, p) -> bool:
+        # locked players always start, the age range applies to the bench as well
+        if p['Name'] in self.locked_players:
+            return False
+        return self.avg_age is None or self.avg_age[0] <= p['Age'] <= self.avg_age[1]
+
+    def _undominated(self) -> List[Dict]:
+        """Players not dominated in every slot, plus the locked players
+
+        Slots are the XI roles and the bench lines. Per slot the eligible
+        players are swept by wage (ties: best rated first) keeping a heap of
+        the `squad size` best ratings seen so far; a player whose rating does
+        not beat the smallest of a full heap has that many dominators.
+        """
+        squad_size = self.total_players + self.bench_size
+        eligible = [p for p in self.players if self._bench_eligible(p)]
+        slots = defaultdict(list)
+        for i, p in enumerate(eligible):
+            for r in p['PossiblePositions']:
+                slots[('XI', r)].append((p['WageEUR'], -p['rating_per_roles'][r], i))
+            for line, rating in self._line_ratings(p).items():
+                slots[('bench', line)].append((p['WageEUR'], -rating, i))
+        keep = set()
+        for entries in slots.values():
+            entries.sort()
+            best = []
+            for _, rating, i in entries:
+                rating = -rating
+                if len(best) < squad_size:
+                    keep.add(i)
+                    heapq.heappush(best, rating)
+                elif rating > best[0]:
+                    keep.add(i)
+                    heapq.heapreplace(best, rating)
+        return ([p for p in self.players if p['Name'] in self.locked_players]
+                + [p for i, p in enumerate(eligible) if i in keep])
+
+    def _build_bench_variables(self, bench_players):
+        # y[player, line] ∈ {0,1}: player sits on the bench as cover for that line
+        self.bench_players = bench_players
+        self.y = {(p['Name'], line): pl.LpVariable(f"y_{p['Name']}_{line}", cat="Binary")
+                  for p in bench_players
+                  for line in self._line_ratings(p)}
+
+    def _bench_objective(self):
+        return self.bench_weight * pl.lpSum(rating * self.y[(p['Name'], line)]
+                                            for p in self.bench_players
+                                            for line, rating in self._line_ratings(p).items())
+
+    def _bench_wage(self):
+        return pl.lpSum(self.y[(p['Name'], line)] * p['WageEUR']
+                        for p in self.bench_players
+                        for line in self._line_ratings(p))
+
+    def _add_bench_constraints(self, model):
+        model += pl.lpSum(self.y.values()) == self.bench_size
+        for line, required in self.bench_cover.items():
+            model += pl.lpSum(var for (_, l), var in self.y.items() if l == line) >= required
+
+    # --- joint model: extends the XI model with the bench variables ---
+
+    def build_variables(self):
+        super().build_variables()
+        self._build_bench_variables([p for p in self.players if self._bench_eligible(p)])
+
+    def build_objective(self):
+        xi_objective = pl.lpSum(p["rating_per_roles"][r] * self.x[(p["Name"], r)]
+                                for p in self.players
+                                for r in p["PossiblePositions"])
+        self.model += xi_objective + self._bench_objective()
+
+    def build_constraints(self):
+        super().build_constraints()
+        # a player either starts or sits on the bench, in at most one role / line
+        lines_of = {p['Name']: self._line_ratings(p) for p in self.bench_players}
+        for p in self.players:
+            if p['Name'] in lines_of:
+                self.model += (pl.lpSum(self.x[(p["Name"], r)] for r in p["PossiblePositions"])
+                               + pl.lpSum(self.y[(p['Name'], line)] for line in lines_of[p['Name']])) <= 1
+        self._add_bench_constraints(self.model)
+        # combined wage budget
+        self.model += pl.lpSum(self.x[(p['Name'], r)] * p['WageEUR']
+                               for p in self.players
+                               for r in p['PossiblePositions']) + self._bench_wage() <= self.budget
+
+    def _extract_bench(self):
+        wages = {p['Name']: p for p in self.bench_players}
+        bench = []
+        for (name, line), var in self.y.items():
+            if var.value() is not None and var.value() > 0.5:
+                p = wages[name]
+                bench.append({"Name": name, "line": line,
+                              "Rating": p['Overall'], "WageEur": p['WageEUR'], "Age": p['Age']})
+        return bench
+
+    def _combine(self, xi, objective):
+        bench = self._extract_bench()
+        bench_budget = sum(b['WageEur'] for b in bench)
+        ages = [xi['average age'] * len(xi['selected_players'])] + [b['Age'] for b in bench]
+        return {"status": xi['status'],
+                "objective": objective,
+                "selected_players": xi['selected_players'],
+                "bench": bench,
+                'total_budget': xi['total_budget'] + bench_budget,
+                'xi_budget': xi['total_budget'],
+                'bench_budget': bench_budget,
+                'average age': xi['average age'],
+                'squad average age': sum(ages) / (len(xi['selected_players']) + len(bench)),
+                'kept_players': len(self.players)}
+
+    def solve(self, solver=None):
+        if self.prune_dominated:
+            # the joint model reads player records, so the pruned pool replaces
+            # a columnar one as well
+            self.players = self._undominated()
+            self.columnar = None
+        xi = super().solve(solver)
+        if xi['status'] != 'Optimal':
+            return xi
+        return self._combine(xi, xi['objective'])
@@ -0,0 +1,81 @@
+import copy
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class SquadResultCache:
+    """Bounded, thread-safe LRU cache of solver results shared by all sessions
+
+    Keys are built from the optimizer inputs (see `make_key`), values are the
+    dicts returned by `optimize_squad`. Callers always get a copy back so one
+    session can never modify another session's result.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(budget, formation, style, age: Optional[Tuple], locked_players: Dict) -> Hashable:
+        locked = tuple(sorted((name, info['role']) for name, info in (locked_players or {}).items()))
+        return (budget, tuple(formation), style, tuple(age) if age else None, locked)
+
+    def get(self, key: Hashable):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(self._entries[key])
+
+    def put(self, key: Hashable, result: Dict) -> None:
+        with self._lock:
+            self._entries[key] = copy.deepcopy(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_solve(self, key: Hashable, solve_fn: Callable[[], Dict]) -> Tuple[Dict, bool]:
+        """Return (result, hit). The solve runs outside the lock so one slow
+        MILP does not block other sessions; two sessions racing on the same
+        key may both solve, the last one wins."""
+        result = self.get(key)
+        if result is not None:
+            return result, True
+        result = solve_fn()
+        self.put(key, result)
+        return result, False
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'entries': len(self._entries),
+                    'max_entries': self.max_entries,
+                    'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'hit_rate': self.hits / lookups if lookups else 0.0}
+
+
+def estimate_session_bytes(session_state) -> int:
+    """Rough per-session footprint: pickled size of the session state values"""
+    total = 0
+    for key in list(session_state.keys()):
+        try:
+            total += len(pickle.dumps(session_state[key]))
+        except Exception:
+            # widgets / unpicklable values are not owned by the session data
+            continue
+    return total
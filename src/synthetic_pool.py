@@ -0,0 +1,71 @@
+import numpy as np
+from typing import Dict, List
+
+# same role -> line mapping the FIFA dataset notebook uses
+GLOBAL_POSITION = {
+    "CB": "DF", "RB": "DF", 'LB': 'DF', 'RWB': 'DF', 'LWB': 'DF',
+    "CDM": "MF", "CAM": "MF", 'LM': 'MF', 'RM': 'MF', 'CM': 'MF',
+    "ST": "FW", "CF": "FW", 'LF': 'FW', 'RF': 'FW', "RW": "FW", 'LW': 'FW',
+    "GK": "GK"
+}
+
+# roles a player can also cover, keyed by the player's best position
+NEIGHBOUR_ROLES = {
+    'CB': ['CDM', 'RB', 'LB'], 'RB': ['RWB', 'CB', 'RM'], 'LB': ['LWB', 'CB', 'LM'],
+    'RWB': ['RB', 'RM'], 'LWB': ['LB', 'LM'],
+    'CDM': ['CM', 'CB'], 'CM': ['CDM', 'CAM'], 'CAM': ['CM', 'CF', 'ST'],
+    'LM': ['LW', 'CM', 'LB'], 'RM': ['RW', 'CM', 'RB'],
+    'ST': ['CF', 'LW', 'RW'], 'CF': ['ST', 'CAM'], 'LF': ['LW', 'CF'], 'RF': ['RW', 'CF'],
+    'LW': ['LM', 'ST', 'LF'], 'RW': ['RM', 'ST', 'RF'],
+    'GK': [],
+}
+
+# rough share of best positions in a real pool
+BEST_POSITION_WEIGHTS = {
+    'GK': 0.11, 'CB': 0.18, 'RB': 0.06, 'LB': 0.06, 'RWB': 0.01, 'LWB': 0.01,
+    'CDM': 0.07, 'CM': 0.11, 'CAM': 0.07, 'LM': 0.04, 'RM': 0.04,
+    'ST': 0.12, 'CF': 0.01, 'LF': 0.005, 'RF': 0.005, 'LW': 0.04, 'RW': 0.04,
+}
+
+
+def generate_synthetic_pool(n_players: int, seed: int = 0, n_nations: int = 60,
+                            players_per_club: int = 28) -> List[Dict]:
+    """Synthetic player pool with the same record layout as final_squad_cleaned.json
+
+    Used by the benchmark scripts so large-pool timings do not depend on the
+    real dataset being present.
+    """
+    rng = np.random.default_rng(seed)
+    roles = list(BEST_POSITION_WEIGHTS)
+    weights = np.array(list(BEST_POSITION_WEIGHTS.values()))
+    best = rng.choice(roles, size=n_players, p=weights / weights.sum())
+    overall = np.clip(rng.normal(66, 7, n_players), 45, 93).round()
+    age = rng.integers(17, 38, n_players)
+    # wages grow roughly exponentially with rating, like the real data
+    wage = (np.exp((overall - 45) / 7.5) * 500 * rng.uniform(0.6, 1.4, n_players)).round(-2)
+    n_extra = rng.integers(0, 3, n_players)
+    nation = rng.zipf(1.6, n_players) % n_nations
+    n_clubs = max(1, n_players // players_per_club)
+    club = rng.integers(0, n_clubs, n_players)
+    left_footed = rng.random(n_players) < 0.25
+
+    players = []
+    for i in range(n_players):
+        extra = list(rng.permutation(NEIGHBOUR_ROLES[best[i]])[:n_extra[i]])
+        positions = [str(best[i])] + [str(r) for r in extra]
+        ratings = {r: float(overall[i] - (0 if k == 0 else rng.integers(1, 6)))
+                   for k, r in enumerate(positions)}
+        players.append({
+            'Name': f'Player {i:06d}',
+            'Age': int(age[i]),
+            'Nationality': f'Nation {nation[i]:02d}',
+            'Club': f'Club {club[i]:04d}',
+            'PreferredFoot': 'Left' if left_footed[i] else 'Right',
+            'Overall': int(overall[i]),
+            'WageEUR': int(wage[i]),
+            'BestPosition': str(best[i]),
+            'PossiblePositions': positions,
+            'GlobalPos': {r: GLOBAL_POSITION[r] for r in positions},
+            'rating_per_roles': ratings,
+        })
+    return players
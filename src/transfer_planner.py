@@ -0,0 +1,161 @@
+import time
+from typing import Callable, Dict, List, Tuple
+
+import pulp as pl
+
+from src.milp_solver import SquadMILPSolver
+
+# yearly rating multiplier by age: young players improve, veterans decline
+AGE_CURVE = [(21, 1.04), (24, 1.02), (28, 1.0), (31, 0.98), (200, 0.95)]
+
+
+def _age_factor(age: int) -> float:
+    for max_age, factor in AGE_CURVE:
+        if age < max_age:
+            return factor
+    return AGE_CURVE[-1][1]
+
+
+def project_player(p: Dict, seasons_ahead: int, wage_growth: float = 0.05) -> Dict:
+    """Player record `seasons_ahead` seasons from now: older, re-rated along
+    the age curve and with a wage grown by `wage_growth` per season"""
+    factor = 1.0
+    for k in range(seasons_ahead):
+        factor *= _age_factor(p['Age'] + k)
+    projected = dict(p)
+    projected['Age'] = p['Age'] + seasons_ahead
+    projected['WageEUR'] = int(p['WageEUR'] * (1 + wage_growth) ** seasons_ahead)
+    projected['Overall'] = p['Overall'] * factor
+    projected['rating_per_roles'] = {r: v * factor for r, v in p['rating_per_roles'].items()}
+    return projected
+
+
+class WindowSquadSolver(SquadMILPSolver):
+    """XI for one transfer window, limited to `max_changes` new players
+    compared with the previous window's squad and warm-started from it"""
+
+    def __init__(self, *args, previous_squad: Dict = None, max_changes: int = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.previous_squad = previous_squad or {}  # name -> role
+        self.max_changes = max_changes
+
+    def _retainable(self) -> List[Dict]:
+        """Previous squad players that can still be kept this window: in the
+        projected pool, inside the age range and, cheapest first, within the budget"""
+        eligible = sorted((p for p in self.players if p['Name'] in self.previous_squad
+                           and (self.avg_age is None or self.avg_age[0] <= p['Age'] <= self.avg_age[1])),
+                          key=lambda p: p['WageEUR'])
+        retainable, wage = [], 0
+        for p in eligible:
+            if wage + p['WageEUR'] > self.budget:
+                break
+            retainable.append(p)
+            wage += p['WageEUR']
+        return retainable
+
+    def build_constraints(self):
+        super().build_constraints()
+        if self.previous_squad and self.max_changes is not None:
+            # churn cap: keep at least (previous squad players still eligible - max_changes),
+            # players who aged out or no longer fit the budget do not count as changes
+            retainable = self._retainable()
+            retained = pl.lpSum(self.x[(p['Name'], r)] for p in retainable for r in p['PossiblePositions'])
+            self.model += retained >= min(len(retainable), self.total_players) - self.max_changes
+
+    def warm_start(self):
+        # previous squad in its previous roles as the incumbent solution
+        for (name, role), var in self.x.items():
+            var.setInitialValue(1 if self.previous_squad.get(name) == role else 0)
+
+    def solve(self, solver=None):
+        self.build_variables()
+        self.build_objective()
+        self.build_constraints()
+        if self.previous_squad:
+            self.warm_start()
+        self.model.solve(solver)
+        return self.extract_solution()
+
+
+class TransferPlanner:
+    """Rolling-horizon squad plan over several transfer windows
+
+    Instead of one model over all windows, each window is a single-period MILP:
+    players are projected to that season, ratings look `lookahead` seasons
+    further (discounted) so the plan does not sell a rising player for a
+    short-term gain, churn against the previous window is capped and the
+    previous squad warm-starts the solver.
+    Each window reports the MILP `objective` (including the discounted
+    lookahead) and its `season_score`, the XI's ratings for that season only.
+    """
+
+    def __init__(
+        self,
+        player_info: List[Dict],
+        formation: Tuple[int, int, int, int],
+        playing_style: str,
+        budgets: List[int],  # wage budget per window
+        max_changes: int,  # new players allowed per window
+        age: Tuple = None,  # (min,max)
+        locked_players: Dict = None,  # only applied to the first window
+        lookahead: int = 1,
+        discount: float = 0.8,
+        projection: Callable[[Dict, int], Dict] = project_player):
+
+        self.players = player_info
+        self.formation = formation
+        self.style = playing_style
+        self.budgets = budgets
+        self.max_changes = max_changes
+        self.age = age
+        self.locked_players = locked_players or {}
+        self.lookahead = lookahead
+        self.discount = discount
+        self.projection = projection
+
+    def _window_pool(self, window: int) -> List[Dict]:
+        pool = []
+        for p in self.players:
+            current = self.projection(p, window)
+            # objective ratings: discounted sum over the lookahead seasons
+            future = [self.projection(p, window + k) for k in range(1, self.lookahead + 1)]
+            rating = dict(current['rating_per_roles'])
+            for k, f in enumerate(future, start=1):
+                for r, v in f['rating_per_roles'].items():
+                    rating[r] += self.discount ** k * v
+            current['rating_per_roles'] = rating
+            pool.append(current)
+        return pool
+
+    def _season_score(self, squad: Dict, window: int) -> float:
+        # ratings of the squad (name -> role) in the window's season, without lookahead
+        by_name = {p['Name']: p for p in self.players if p['Name'] in squad}
+        return sum(self.projection(by_name[name], window)['rating_per_roles'][role]
+                   for name, role in squad.items())
+
+    def plan(self, solver=None) -> List[Dict]:
+        if solver is None:
+            solver = pl.PULP_CBC_CMD(msg=0, warmStart=True)
+        plan = []
+        previous = {}
+        for window, budget in enumerate(self.budgets):
+            start = time.perf_counter()
+            window_solver = WindowSquadSolver(
+                self._window_pool(window), formation=self.formation, age=self.age,
+                total_budget=budget, playing_style=self.style,
+                locked_players=self.locked_players if window == 0 else {},
+                previous_squad=previous, max_changes=self.max_changes)
+            results = window_solver.solve(solver)
+            results['window'] = window
+            results['solve_time'] = time.perf_counter() - start
+            if results['status'] != 'Optimal':
+                # later windows depend on this one, stop the plan here
+                plan.append(results)
+                break
+            squad = {p['Name']: p['role'] for p in results['selected_players']}
+            results['season_score'] = self._season_score(squad, window)
+            results['signed'] = sorted(set(squad) - set(previous)) if previous else []
+            results['released'] = sorted(set(previous) - set(squad))
+            plan.append(results)
+            previous = squad
+        return plan